@@ -5,25 +5,97 @@ This module implements a serverless API with multiple endpoints for health check
 file upload, and basic greeting functionality.
 """
 
-from typing import Dict, Any, Union, cast
+import functools
+import os
+import orjson
+from typing import TYPE_CHECKING, Callable, Dict, Any, Optional, Tuple, Union, cast
 from aws_lambda_powertools.event_handler import APIGatewayRestResolver
-from aws_lambda_powertools.utilities.typing import LambdaContext
-from aws_lambda_powertools.logging import correlation_paths
+from aws_lambda_powertools.event_handler import LambdaFunctionUrlResolver
 from aws_lambda_powertools import Logger
 from aws_lambda_powertools import Tracer
 from aws_lambda_powertools import Metrics
 from aws_lambda_powertools.metrics import MetricUnit
 from aws_lambda_powertools.event_handler import Response
 
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it at runtime costs cold-start time
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+
+
+def _serialize(body: Any) -> str:
+    """Serialize a response body to JSON using orjson."""
+    return orjson.dumps(body).decode()
+
+
 # Initialize Powertools components
-app = APIGatewayRestResolver()
-tracer = Tracer(service="HelloWorldAPI")
+app = APIGatewayRestResolver(serializer=_serialize)
 logger = Logger(service="HelloWorldAPI")
 metrics = Metrics(namespace="HelloWorldAPI", service="HelloWorldAPI")
 
+# Creating a Tracer imports the X-Ray SDK, so defer it until a traced call needs it
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """
+    Return the shared Tracer, creating it on first use.
+
+    Returns:
+        Tracer: Powertools tracer for this service
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(service="HelloWorldAPI")
+    return _tracer
+
+
+def _trace_lazily(
+    capture: str,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Apply a Tracer decorator on first call instead of at import time.
+
+    Args:
+        capture (str): Tracer decorator name, e.g. "capture_method"
+
+    Returns:
+        Callable: Decorator deferring Tracer creation to the first invocation
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        traced: Optional[Callable[..., Any]] = None
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            nonlocal traced
+            if traced is None:
+                traced = getattr(get_tracer(), capture)(func)
+            return traced(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Initialization that runs ahead of the first request pays for the tracer there
+if os.environ.get("AWS_LAMBDA_INITIALIZATION_TYPE") in (
+    "snap-start",
+    "provisioned-concurrency",
+):
+    get_tracer()
+
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024  # 10MB limit
+_COUNT = MetricUnit.Count
+
+
+# Constant payloads for the static routes, shared across invocations.
+# The resolver only serializes route return values, so they are never mutated.
+_ROOT_RESPONSE: Dict[str, str] = {"message": "Hello World", "status": "ok"}
+_HELLO_RESPONSE: Dict[str, str] = {"message": "hello world"}
+_HEALTHCHECK_RESPONSE: Dict[str, str] = {"message": "healthcheck", "status": "healthy"}
+
 
 @app.get("/")
-@tracer.capture_method
 def root() -> Dict[str, Any]:
     """
     Root endpoint that returns a basic greeting.
@@ -32,12 +104,10 @@ def root() -> Dict[str, Any]:
         Dict[str, Any]: Response containing message and status
     """
     logger.info("Root endpoint called")
-    metrics.add_metric(name="RootEndpointInvocations", unit=MetricUnit.Count, value=1)
-    return {"message": "Hello World", "status": "ok"}
+    return _ROOT_RESPONSE
 
 
 @app.get("/hello")
-@tracer.capture_method
 def hello() -> Dict[str, str]:
     """
     Hello endpoint that returns a simple greeting message.
@@ -46,12 +116,25 @@ def hello() -> Dict[str, str]:
         Dict[str, str]: Response containing hello world message
     """
     logger.info("Hello endpoint called")
-    metrics.add_metric(name="HelloEndpointInvocations", unit=MetricUnit.Count, value=1)
-    return {"message": "hello world"}
+    return _HELLO_RESPONSE
+
+
+def _body_too_large() -> Response:
+    """
+    Build the response returned for uploads over MAX_UPLOAD_BYTES.
+
+    Returns:
+        Response: HTTP 400 response
+    """
+    return Response(
+        status_code=400,
+        content_type="application/json",
+        body={"error": "Request body too large"},
+    )
 
 
 @app.post("/upload")
-@tracer.capture_method
+@_trace_lazily("capture_method")
 def upload() -> Union[Dict[str, str], Response]:
     """
     Upload endpoint placeholder for file upload functionality.
@@ -60,35 +143,33 @@ def upload() -> Union[Dict[str, str], Response]:
         Dict[str, str] or Response: Response indicating upload API status
     """
     try:
-        # Get the request body for processing
-        request_body = app.current_event.body
-        logger.info(
-            "Upload endpoint called",
-            extra={"body_length": len(request_body) if request_body else 0},
-        )
+        # Reject on the declared size first so oversized bodies are never decoded
+        content_length = app.current_event.headers.get("Content-Length") or ""
+        if content_length.isdecimal() and int(content_length) > MAX_UPLOAD_BYTES:
+            logger.info(
+                "Upload endpoint called",
+                extra={"body_length": int(content_length)},
+            )
+            return _body_too_large()
 
-        metrics.add_metric(
-            name="UploadEndpointInvocations", unit=MetricUnit.Count, value=1
-        )
+        # Get the request body for processing (as sent; base64 is not decoded)
+        request_body = app.current_event.body
+        body_length = len(request_body) if request_body else 0
+        logger.info("Upload endpoint called", extra={"body_length": body_length})
 
-        # Add basic validation
-        if request_body and len(request_body) > 10 * 1024 * 1024:  # 10MB limit
-            return Response(
-                status_code=400,
-                content_type="application/json",
-                body={"error": "Request body too large"},
-            )
+        # Content-Length may be absent, so validate the body itself as well
+        if body_length > MAX_UPLOAD_BYTES:
+            return _body_too_large()
 
         return {"message": "Upload API - HTTP 200"}
 
     except Exception as e:
         logger.error("Upload endpoint error", extra={"error": str(e)})
-        metrics.add_metric(name="UploadEndpointErrors", unit=MetricUnit.Count, value=1)
+        metrics.add_metric(name="UploadEndpointErrors", unit=_COUNT, value=1)
         raise
 
 
 @app.get("/healthcheck")
-@tracer.capture_method
 def healthcheck() -> Dict[str, str]:
     """
     Health check endpoint for monitoring application status.
@@ -96,42 +177,189 @@ def healthcheck() -> Dict[str, str]:
     Returns:
         Dict[str, str]: Response indicating service health status
     """
-    # Add custom metrics
-    metrics.add_metric(name="HealthcheckInvocations", unit=MetricUnit.Count, value=1)
-
     # Structured logging
     logger.info("Healthcheck API - HTTP 200")
 
-    return {"message": "healthcheck", "status": "healthy"}
+    return _HEALTHCHECK_RESPONSE
 
 
-# Main Lambda handler with all Powertools decorators
-@logger.inject_lambda_context(correlation_id_path=correlation_paths.API_GATEWAY_REST)
-@tracer.capture_lambda_handler
-@metrics.log_metrics(capture_cold_start_metric=True)
-def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, Any]:
+# Function URL (payload v2) events use their own resolver with the same routes
+url_app = LambdaFunctionUrlResolver(serializer=_serialize)
+url_app.get("/")(root)
+url_app.get("/hello")(hello)
+url_app.post("/upload")(upload)
+url_app.get("/healthcheck")(healthcheck)
+
+
+# Invocation metric emitted once per request by the handler, keyed by route.
+# /healthcheck has none: pings are answered before the metrics stack runs.
+_ROUTE_METRICS: Dict[Tuple[str, str], str] = {
+    ("GET", "/"): "RootEndpointInvocations",
+    ("GET", "/hello"): "HelloEndpointInvocations",
+    ("POST", "/upload"): "UploadEndpointInvocations",
+}
+
+# Pre-serialized bodies for the static routes, used when app.resolve is skipped
+_ROOT_BODY = _serialize(_ROOT_RESPONSE)
+_HELLO_BODY = _serialize(_HELLO_RESPONSE)
+_HEALTHCHECK_BODY = _serialize(_HEALTHCHECK_RESPONSE)
+
+# Static routes served without the resolver's per-request route matching.
+# lambda_handler never calls root(), hello() or healthcheck() for these routes,
+# so their INFO logs and per-route trace subsegments are skipped; the functions
+# are only reached through app.resolve or url_app.resolve. /upload needs
+# app.current_event, so it is always served by a resolver.
+_ROUTES: Dict[Tuple[str, str], str] = {
+    ("GET", "/"): _ROOT_BODY,
+    ("GET", "/hello"): _HELLO_BODY,
+    ("GET", "/healthcheck"): _HEALTHCHECK_BODY,
+}
+
+
+def _is_function_url(event: Dict[str, Any]) -> bool:
+    """Return True for a Lambda Function URL (payload v2) event."""
+    return "http" in (event.get("requestContext") or {})
+
+
+def _route_key(event: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Return the (method, path) of an API Gateway REST or Function URL event.
+
+    Args:
+        event (Dict[str, Any]): API Gateway REST or Function URL event
+
+    Returns:
+        Tuple[str, str]: HTTP method and path
+    """
+    http = (event.get("requestContext") or {}).get("http")
+    if http is None:
+        return event.get("httpMethod", ""), event.get("path", "")
+    return http.get("method", ""), event.get("rawPath", "")
+
+
+def _json_response(
+    body: str, status_code: int = 200, function_url: bool = False
+) -> Dict[str, Any]:
+    """
+    Build a proxy response in the same shape as the Powertools resolvers.
+
+    Args:
+        body (str): Serialized JSON response body
+        status_code (int): HTTP status code
+        function_url (bool): Build a Function URL response, which only supports
+            single-value headers
+
+    Returns:
+        Dict[str, Any]: API Gateway or Function URL response
+    """
+    if function_url:
+        return {
+            "statusCode": status_code,
+            "body": body,
+            "isBase64Encoded": False,
+            "headers": {"Content-Type": "application/json"},
+        }
+    return {
+        "statusCode": status_code,
+        "body": body,
+        "isBase64Encoded": False,
+        "multiValueHeaders": {"Content-Type": ["application/json"]},
+    }
+
+
+_HEALTHCHECK = ("GET", "/healthcheck")
+
+# Set HEALTHCHECK_FULL_TRACE=1 to route health pings through the instrumented path
+_HEALTHCHECK_FULL_TRACE = os.environ.get("HEALTHCHECK_FULL_TRACE") == "1"
+
+# The first invocation in a sandbox is always logged and reported by the
+# ColdStart metric, even when it is a health ping
+_first_invocation = True
+
+
+def lambda_handler(event: Dict[str, Any], context: "LambdaContext") -> Dict[str, Any]:
     """
     AWS Lambda handler function.
 
+    Health pings are answered directly, without logging, metrics or tracing; a
+    ping that is the first invocation in a sandbox only reports the cold start.
+    Every other request is handled by the instrumented request handler.
+
+    Args:
+        event (Dict[str, Any]): API Gateway or Function URL event
+        context (LambdaContext): Lambda context object
+
+    Returns:
+        Dict[str, Any]: API Gateway or Function URL response
+    """
+    global _first_invocation
+    is_health_ping = not _HEALTHCHECK_FULL_TRACE and _route_key(event) == _HEALTHCHECK
+    if is_health_ping and not _first_invocation:
+        return _json_response(_HEALTHCHECK_BODY, function_url=_is_function_url(event))
+
+    _first_invocation = False
+
+    # Same value as correlation_paths.API_GATEWAY_REST, without a JMESPath query.
+    # Set before inject_lambda_context runs so the logged event carries this id.
+    logger.set_correlation_id((event.get("requestContext") or {}).get("requestId"))
+
+    if is_health_ping:
+        return cast(Dict[str, Any], _report_cold_start_ping(event, context))
+    return cast(Dict[str, Any], _handle_request(event, context))
+
+
+# No tracer here, so a sandbox that only serves health pings never loads X-Ray
+@logger.inject_lambda_context
+@metrics.log_metrics(capture_cold_start_metric=True)
+def _report_cold_start_ping(
+    event: Dict[str, Any], context: "LambdaContext"
+) -> Dict[str, Any]:
+    """
+    Answer a health ping that is the first invocation in a sandbox.
+
+    Args:
+        event (Dict[str, Any]): API Gateway or Function URL event
+        context (LambdaContext): Lambda context object
+
+    Returns:
+        Dict[str, Any]: API Gateway or Function URL response
+    """
+    return _json_response(_HEALTHCHECK_BODY, function_url=_is_function_url(event))
+
+
+# Main request handler with all Powertools decorators
+@logger.inject_lambda_context
+@_trace_lazily("capture_lambda_handler")
+@metrics.log_metrics(capture_cold_start_metric=True)
+def _handle_request(event: Dict[str, Any], context: "LambdaContext") -> Dict[str, Any]:
+    """
+    Instrumented API Gateway and Function URL request handler.
+
     Args:
-        event (Dict[str, Any]): API Gateway event
+        event (Dict[str, Any]): API Gateway or Function URL event
         context (LambdaContext): Lambda context object
 
     Returns:
-        Dict[str, Any]: API Gateway response
+        Dict[str, Any]: API Gateway or Function URL response
     """
     try:
-        logger.info(
-            "Lambda invocation started",
-            extra={
-                "request_id": context.aws_request_id,
-                "function_name": context.function_name,
-            },
-        )
+        function_url = _is_function_url(event)
+        route_key = _route_key(event)
+        metric_name = _ROUTE_METRICS.get(route_key)
+        if metric_name is not None:
+            metrics.add_metric(name=metric_name, unit=_COUNT, value=1)
 
-        response = app.resolve(event, context)
+        static_body = _ROUTES.get(route_key)
+        if static_body is not None:
+            response = _json_response(static_body, function_url=function_url)
+        elif function_url:
+            response = url_app.resolve(event, context)
+        else:
+            response = app.resolve(event, context)
 
-        logger.info("Lambda invocation completed successfully")
+        # inject_lambda_context already stamps the request id onto every record,
+        # so completion is only logged at DEBUG (or for sampled invocations)
+        logger.debug("Lambda invocation completed successfully")
         return cast(Dict[str, Any], response)
 
     except Exception as e:
@@ -143,5 +371,29 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                 "request_id": context.aws_request_id,
             },
         )
-        metrics.add_metric(name="LambdaHandlerErrors", unit=MetricUnit.Count, value=1)
+        metrics.add_metric(name="LambdaHandlerErrors", unit=_COUNT, value=1)
         raise
+
+
+def lambda_handler_fast(
+    event: Dict[str, Any], context: "LambdaContext"
+) -> Dict[str, Any]:
+    """
+    Lightweight handler for Lambda Function URL and API Gateway REST events.
+
+    Static routes are served straight from the pre-serialized route table, with
+    no Powertools event parsing, logging, metrics or tracing, so they emit no
+    per-route invocation metric. The first invocation in a sandbox and every
+    other route are delegated to lambda_handler, which reports the cold start.
+
+    Args:
+        event (Dict[str, Any]): Function URL (payload v2) or API Gateway REST event
+        context (LambdaContext): Lambda context object
+
+    Returns:
+        Dict[str, Any]: Function URL or API Gateway response
+    """
+    static_body = _ROUTES.get(_route_key(event))
+    if static_body is not None and not _first_invocation:
+        return _json_response(static_body, function_url=_is_function_url(event))
+    return lambda_handler(event, context)
@@ -4,12 +4,15 @@ Comprehensive unit tests for the Hello World Lambda function.
 This module provides thorough test coverage for all endpoints and error scenarios.
 """
 
-import json
+import importlib
+import io
+import orjson
 import pytest
 import sys
 import os
 from unittest.mock import patch, MagicMock
 from typing import Dict, Any
+from aws_lambda_powertools.metrics.provider import cold_start
 
 # Add the parent directory to the Python path to allow imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", ".."))
@@ -20,6 +23,16 @@ from hello_world import app
 class MockLambdaContext:
     """Mock Lambda context for testing."""
 
+    __slots__ = (
+        "function_name",
+        "memory_limit_in_mb",
+        "invoked_function_arn",
+        "aws_request_id",
+        "log_group_name",
+        "log_stream_name",
+        "remaining_time_in_millis",
+    )
+
     def __init__(self):
         self.function_name = "test-func"
         self.memory_limit_in_mb = 256
@@ -35,159 +48,171 @@ class MockLambdaContext:
         return self.remaining_time_in_millis
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def lambda_context():
-    """Fixture providing mock Lambda context."""
+    """Fixture providing a read-only mock Lambda context."""
     return MockLambdaContext()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def api_gateway_event():
-    """Fixture providing a basic API Gateway event."""
+    """Fixture providing a minimal, read-only API Gateway event.
+
+    Only the keys APIGatewayRestResolver and the handler actually read are set.
+    """
     return {
         "body": "",
-        "headers": {
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Accept-Language": "en-US,en;q=0.5",
-            "Connection": "keep-alive",
-            "Host": "127.0.0.1:3000",
-            "User-Agent": "Mozilla/5.0 (compatible; test-agent)",
-            "X-Forwarded-Port": "3000",
-            "X-Forwarded-Proto": "http",
-        },
+        "headers": {},
         "httpMethod": "GET",
-        "isBase64Encoded": False,
-        "multiValueHeaders": {},
-        "multiValueQueryStringParameters": None,
         "path": "/hello",
-        "pathParameters": None,
-        "queryStringParameters": None,
         "requestContext": {
-            "accountId": "123456789012",
-            "apiId": "1234567890",
-            "domainName": "127.0.0.1:3000",
-            "extendedRequestId": "test-extended-id",
             "httpMethod": "GET",
-            "identity": {
-                "accountId": None,
-                "apiKey": None,
-                "caller": None,
-                "cognitoAuthenticationProvider": None,
-                "cognitoAuthenticationType": None,
-                "cognitoIdentityPoolId": None,
-                "sourceIp": "127.0.0.1",
-                "user": None,
-                "userAgent": "test-agent",
-                "userArn": None,
-            },
+            "identity": {"sourceIp": "127.0.0.1"},
             "path": "/hello",
-            "protocol": "HTTP/1.1",
             "requestId": "test-request-id",
-            "requestTime": "01/Jan/2024:12:00:00 +0000",
-            "requestTimeEpoch": 1704110400,
-            "resourceId": "123456",
             "resourcePath": "/hello",
-            "stage": "Prod",
         },
         "resource": "/hello",
-        "stageVariables": None,
-        "version": "1.0",
     }
 
 
+@pytest.fixture(autouse=True)
+def patch_powertools(monkeypatch):
+    """Fixture replacing the module logger and metrics with mocks for every test."""
+    mock_logger, mock_metrics = MagicMock(), MagicMock()
+    monkeypatch.setattr("hello_world.app.logger", mock_logger)
+    monkeypatch.setattr("hello_world.app.metrics", mock_metrics)
+    return mock_logger, mock_metrics
+
+
+@pytest.fixture
+def event_logging_app(monkeypatch):
+    """Fixture reloading the app with POWERTOOLS_LOGGER_LOG_EVENT enabled.
+
+    The setting is read when the handler is decorated, so the module is reloaded
+    with it set, and reloaded again afterwards to restore the default handler.
+    """
+    monkeypatch.setenv("POWERTOOLS_LOGGER_LOG_EVENT", "true")
+    importlib.reload(app)
+    yield app
+    monkeypatch.undo()
+    importlib.reload(app)
+
+
 def create_event_for_path(
     base_event: Dict[str, Any], path: str, method: str = "GET"
 ) -> Dict[str, Any]:
-    """Create an API Gateway event for a specific path and method."""
-    event = base_event.copy()
-    event["path"] = path
-    event["httpMethod"] = method
-    event["requestContext"]["path"] = path
-    event["requestContext"]["httpMethod"] = method
-    event["requestContext"]["resourcePath"] = path
-    event["resource"] = path
-    return event
+    """Create an API Gateway event for a specific path and method.
+
+    The base event is left untouched, so it can be shared between tests.
+    """
+    return {
+        **base_event,
+        "path": path,
+        "httpMethod": method,
+        "resource": path,
+        "requestContext": {
+            **base_event["requestContext"],
+            "path": path,
+            "httpMethod": method,
+            "resourcePath": path,
+        },
+    }
 
 
 class TestHelloWorldEndpoints:
     """Test cases for all API endpoints."""
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
-    def test_root_endpoint(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
-    ):
+    def test_root_endpoint(self, patch_powertools, api_gateway_event, lambda_context):
         """Test the root endpoint returns correct response."""
+        mock_logger, mock_metrics = patch_powertools
         event = create_event_for_path(api_gateway_event, "/")
 
         response = app.lambda_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = orjson.loads(response["body"])
         assert body["message"] == "Hello World"
         assert body["status"] == "ok"
 
-        # Verify logging and metrics
-        mock_logger.info.assert_called()
+        # Served from the route table: no route-level INFO log, only the
+        # handler's DEBUG completion record and the invocation metric
+        mock_logger.info.assert_not_called()
+        mock_logger.debug.assert_called()
         mock_metrics.add_metric.assert_called_with(
             name="RootEndpointInvocations", unit=app.MetricUnit.Count, value=1
         )
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
-    def test_hello_endpoint(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
-    ):
+    def test_hello_endpoint(self, patch_powertools, api_gateway_event, lambda_context):
         """Test the hello endpoint returns correct response."""
+        mock_logger, mock_metrics = patch_powertools
         event = create_event_for_path(api_gateway_event, "/hello")
 
         response = app.lambda_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = orjson.loads(response["body"])
         assert body["message"] == "hello world"
 
-        # Verify logging and metrics
-        mock_logger.info.assert_called()
+        # Served from the route table: no route-level INFO log, only the
+        # handler's DEBUG completion record and the invocation metric
+        mock_logger.info.assert_not_called()
+        mock_logger.debug.assert_called()
         mock_metrics.add_metric.assert_called_with(
             name="HelloEndpointInvocations", unit=app.MetricUnit.Count, value=1
         )
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
+    @patch("hello_world.app._first_invocation", False)
     def test_healthcheck_endpoint(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
+        self, patch_powertools, api_gateway_event, lambda_context
     ):
         """Test the healthcheck endpoint returns correct response."""
+        mock_logger, mock_metrics = patch_powertools
         event = create_event_for_path(api_gateway_event, "/healthcheck")
 
         response = app.lambda_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = orjson.loads(response["body"])
         assert body["message"] == "healthcheck"
         assert body["status"] == "healthy"
 
-        # Verify logging and metrics
-        mock_logger.info.assert_called()
-        mock_metrics.add_metric.assert_called_with(
-            name="HealthcheckInvocations", unit=app.MetricUnit.Count, value=1
-        )
+        # Health pings bypass logging and metrics
+        mock_logger.info.assert_not_called()
+        mock_metrics.add_metric.assert_not_called()
+
+    @patch("hello_world.app._HEALTHCHECK_FULL_TRACE", True)
+    def test_healthcheck_endpoint_full_trace(
+        self, patch_powertools, api_gateway_event, lambda_context
+    ):
+        """Test the healthcheck endpoint is instrumented when full trace is on."""
+        mock_logger, mock_metrics = patch_powertools
+        event = create_event_for_path(api_gateway_event, "/healthcheck")
+
+        response = app.lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = orjson.loads(response["body"])
+        assert body["message"] == "healthcheck"
+        assert body["status"] == "healthy"
+
+        # Instrumented handler runs, but health pings have no invocation metric
+        mock_logger.info.assert_not_called()
+        mock_logger.debug.assert_called()
+        mock_metrics.add_metric.assert_not_called()
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
     def test_upload_endpoint_success(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
+        self, patch_powertools, api_gateway_event, lambda_context
     ):
         """Test the upload endpoint with valid request."""
+        mock_logger, mock_metrics = patch_powertools
         event = create_event_for_path(api_gateway_event, "/upload", "POST")
-        event["body"] = json.dumps({"file": "test-content"})
+        event["body"] = orjson.dumps({"file": "test-content"}).decode()
 
         response = app.lambda_handler(event, lambda_context)
 
         assert response["statusCode"] == 200
-        body = json.loads(response["body"])
+        body = orjson.loads(response["body"])
         assert body["message"] == "Upload API - HTTP 200"
 
         # Verify logging and metrics
@@ -196,16 +221,12 @@ class TestHelloWorldEndpoints:
             name="UploadEndpointInvocations", unit=app.MetricUnit.Count, value=1
         )
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
-    def test_upload_endpoint_large_body(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
-    ):
+    @patch("hello_world.app.MAX_UPLOAD_BYTES", 16)
+    def test_upload_endpoint_large_body(self, api_gateway_event, lambda_context):
         """Test the upload endpoint with oversized request body."""
         event = create_event_for_path(api_gateway_event, "/upload", "POST")
-        # Create a body larger than 10MB
-        large_body = "x" * (11 * 1024 * 1024)  # 11MB
-        event["body"] = large_body
+        # No Content-Length header, so the body itself exceeds the (lowered) limit
+        event["body"] = "x" * 17
 
         response = app.lambda_handler(event, lambda_context)
 
@@ -213,6 +234,38 @@ class TestHelloWorldEndpoints:
         body = response["body"]
         assert "Request body too large" in str(body)
 
+    def test_upload_endpoint_large_content_length(
+        self, api_gateway_event, lambda_context
+    ):
+        """Test the upload endpoint rejects on Content-Length without the body."""
+        event = create_event_for_path(api_gateway_event, "/upload", "POST")
+        event["headers"] = {
+            **event["headers"],
+            "content-length": str(11 * 1024 * 1024),
+        }
+        event["body"] = "x"
+
+        response = app.lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 400
+        body = orjson.loads(response["body"])
+        assert body["error"] == "Request body too large"
+
+    @pytest.mark.parametrize("content_length", ["\u00b2", "abc", "-1", ""])
+    def test_upload_endpoint_malformed_content_length(
+        self, content_length, api_gateway_event, lambda_context
+    ):
+        """Test a malformed Content-Length falls back to the body-length check."""
+        event = create_event_for_path(api_gateway_event, "/upload", "POST")
+        event["headers"] = {**event["headers"], "content-length": content_length}
+        event["body"] = "x"
+
+        response = app.lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = orjson.loads(response["body"])
+        assert body["message"] == "Upload API - HTTP 200"
+
     def test_invalid_path_returns_404(self, api_gateway_event, lambda_context):
         """Test that invalid paths return 404."""
         event = create_event_for_path(api_gateway_event, "/nonexistent")
@@ -221,44 +274,74 @@ class TestHelloWorldEndpoints:
 
         assert response["statusCode"] == 404
 
-    @patch("hello_world.app.logger")
-    @patch("hello_world.app.metrics")
     def test_lambda_handler_logging(
-        self, mock_metrics, mock_logger, api_gateway_event, lambda_context
+        self, patch_powertools, api_gateway_event, lambda_context
     ):
         """Test that Lambda handler properly logs invocation details."""
+        mock_logger, mock_metrics = patch_powertools
+        event = create_event_for_path(api_gateway_event, "/hello")
+
+        app.lambda_handler(event, lambda_context)
+
+        # The request id is injected by Powertools, so no start record is logged
+        info_messages = [call[0][0] for call in mock_logger.info.call_args_list]
+        assert "Lambda invocation started" not in info_messages
+
+        # Completion is only logged at DEBUG
+        mock_logger.debug.assert_called_with("Lambda invocation completed successfully")
+
+    def test_lambda_handler_sets_correlation_id(
+        self, patch_powertools, api_gateway_event, lambda_context
+    ):
+        """Test the API Gateway request id is used as the correlation id."""
+        mock_logger, _ = patch_powertools
         event = create_event_for_path(api_gateway_event, "/hello")
 
         app.lambda_handler(event, lambda_context)
 
-        # Verify invocation start logging
-        start_call = None
-        complete_call = None
+        mock_logger.set_correlation_id.assert_called_once_with("test-request-id")
 
-        for call in mock_logger.info.call_args_list:
-            args = call[0]
-            if len(args) > 0 and "Lambda invocation started" in args[0]:
-                start_call = call
-            elif (
-                len(args) > 0 and "Lambda invocation completed successfully" in args[0]
-            ):
-                complete_call = call
+    def test_logged_event_carries_its_own_correlation_id(
+        self, monkeypatch, event_logging_app, api_gateway_event, lambda_context
+    ):
+        """Test each logged event is tagged with its own request id on warm invokes."""
+        stream = io.StringIO()
+        monkeypatch.setattr(
+            event_logging_app.logger.registered_handler, "stream", stream
+        )
 
-        assert start_call is not None, "Should log invocation start"
-        assert complete_call is not None, "Should log invocation completion"
+        for request_id in ("req-1", "req-2"):
+            event = create_event_for_path(api_gateway_event, "/hello")
+            event["requestContext"] = {
+                **event["requestContext"],
+                "requestId": request_id,
+            }
+            event_logging_app.lambda_handler(event, lambda_context)
+
+        records = [orjson.loads(line) for line in stream.getvalue().splitlines()]
+        event_records = [
+            r
+            for r in records
+            if isinstance(r["message"], dict) and "requestContext" in r["message"]
+        ]
+        assert [r["correlation_id"] for r in event_records] == ["req-1", "req-2"]
+        assert [r["message"]["requestContext"]["requestId"] for r in event_records] == [
+            "req-1",
+            "req-2",
+        ]
 
     @patch("hello_world.app.app.resolve")
-    @patch("hello_world.app.logger")
-    @patch("hello_world.app.metrics")
     def test_lambda_handler_error_handling(
-        self, mock_metrics, mock_logger, mock_resolve, api_gateway_event, lambda_context
+        self, mock_resolve, patch_powertools, api_gateway_event, lambda_context
     ):
         """Test Lambda handler error handling and logging."""
+        mock_logger, mock_metrics = patch_powertools
         # Make resolve raise an exception
         mock_resolve.side_effect = Exception("Test error")
+        event = create_event_for_path(api_gateway_event, "/upload", "POST")
 
         with pytest.raises(Exception, match="Test error"):
-            app.lambda_handler(api_gateway_event, lambda_context)
+            app.lambda_handler(event, lambda_context)
 
         # Verify error logging
         mock_logger.error.assert_called()
@@ -270,14 +353,61 @@ class TestHelloWorldEndpoints:
             name="LambdaHandlerErrors", unit=app.MetricUnit.Count, value=1
         )
 
+    def test_static_route_error_handling(
+        self, patch_powertools, api_gateway_event, lambda_context
+    ):
+        """Test errors raised on the static route fast path are handled."""
+        mock_logger, mock_metrics = patch_powertools
+        event = create_event_for_path(api_gateway_event, "/hello")
+
+        with patch("hello_world.app._json_response") as mock_json_response:
+            mock_json_response.side_effect = Exception("Test error")
+            with pytest.raises(Exception, match="Test error"):
+                app.lambda_handler(event, lambda_context)
+
+        mock_logger.error.assert_called()
+        mock_metrics.add_metric.assert_called_with(
+            name="LambdaHandlerErrors", unit=app.MetricUnit.Count, value=1
+        )
+
+    @pytest.mark.parametrize("path", ["/", "/hello", "/healthcheck"])
+    def test_static_routes_match_resolver(
+        self, path, api_gateway_event, lambda_context
+    ):
+        """Test the route table returns the same response as the resolver."""
+        event = create_event_for_path(api_gateway_event, path)
+
+        response = app.lambda_handler(event, lambda_context)
+        resolved = app.app.resolve(event, lambda_context)
+
+        assert response == resolved
+
+    @pytest.mark.parametrize(
+        "path,payload",
+        [
+            ("/", {"message": "Hello World", "status": "ok"}),
+            ("/hello", {"message": "hello world"}),
+            ("/healthcheck", {"message": "healthcheck", "status": "healthy"}),
+        ],
+    )
+    def test_static_payloads_not_mutated(
+        self, path, payload, api_gateway_event, lambda_context
+    ):
+        """Test the shared route payloads survive repeated resolver calls."""
+        event = create_event_for_path(api_gateway_event, path)
+
+        for _ in range(2):
+            response = app.app.resolve(event, lambda_context)
+            assert orjson.loads(response["body"]) == payload
+
+        assert app._ROUTES[("GET", path)] == orjson.dumps(payload).decode()
+
 
 class TestErrorHandling:
     """Test cases for error handling scenarios."""
 
-    @patch("hello_world.app.metrics")
-    @patch("hello_world.app.logger")
     def test_upload_endpoint_exception_handling(
-        self, mock_logger, mock_metrics, api_gateway_event, lambda_context
+        self, api_gateway_event, lambda_context
     ):
         """Test upload endpoint exception handling."""
         event = create_event_for_path(api_gateway_event, "/upload", "POST")
@@ -308,7 +438,7 @@ class TestIntegration:
             response = app.lambda_handler(event, lambda_context)
 
             assert response["statusCode"] == 200
-            body = json.loads(response["body"])
+            body = orjson.loads(response["body"])
             assert expected_message in body["message"]
 
     def test_cors_headers_present(self, api_gateway_event, lambda_context):
@@ -322,22 +452,182 @@ class TestIntegration:
         # Note: CORS headers are typically added by API Gateway in SAM/CDK deployments
 
 
+def create_function_url_event(path: str, method: str = "GET") -> Dict[str, Any]:
+    """Create a minimal Lambda Function URL (payload v2) event."""
+    return {
+        "version": "2.0",
+        "rawPath": path,
+        "rawQueryString": "",
+        "headers": {"host": "example.lambda-url.us-east-1.on.aws"},
+        "requestContext": {
+            "http": {"method": method, "path": path, "sourceIp": "127.0.0.1"},
+            "requestId": "test-request-id",
+            "routeKey": "$default",
+            "stage": "$default",
+        },
+        "isBase64Encoded": False,
+    }
+
+
+class TestFastHandler:
+    """Test cases for the lightweight Function URL handler."""
+
+    @pytest.mark.parametrize(
+        "path,expected_message",
+        [
+            ("/", "Hello World"),
+            ("/hello", "hello world"),
+            ("/healthcheck", "healthcheck"),
+        ],
+    )
+    @patch("hello_world.app._first_invocation", False)
+    def test_function_url_static_routes(
+        self, path, expected_message, patch_powertools, lambda_context
+    ):
+        """Test Function URL events are served from the route table."""
+        mock_logger, mock_metrics = patch_powertools
+        event = create_function_url_event(path)
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        assert response["headers"] == {"Content-Type": "application/json"}
+        body = orjson.loads(response["body"])
+        assert body["message"] == expected_message
+
+        # No Powertools instrumentation on the fast path
+        mock_logger.debug.assert_not_called()
+        mock_metrics.add_metric.assert_not_called()
+
+    @patch("hello_world.app._first_invocation", True)
+    def test_function_url_first_invocation_is_instrumented(
+        self, patch_powertools, lambda_context
+    ):
+        """Test the first Function URL request goes through lambda_handler."""
+        _, mock_metrics = patch_powertools
+        event = create_function_url_event("/hello")
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        assert response["headers"] == {"Content-Type": "application/json"}
+        mock_metrics.add_metric.assert_called_once_with(
+            name="HelloEndpointInvocations", unit=app._COUNT, value=1
+        )
+
+    def test_function_url_upload(self, patch_powertools, lambda_context):
+        """Test Function URL upload requests are served by the shared routes."""
+        _, mock_metrics = patch_powertools
+        event = create_function_url_event("/upload", "POST")
+        event["body"] = '{"file": "data"}'
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = orjson.loads(response["body"])
+        assert body["message"] == "Upload API - HTTP 200"
+        mock_metrics.add_metric.assert_called_once_with(
+            name="UploadEndpointInvocations", unit=app._COUNT, value=1
+        )
+
+    def test_function_url_upload_too_large(self, lambda_context):
+        """Test Function URL uploads honour the lowercase content-length header."""
+        event = create_function_url_event("/upload", "POST")
+        event["headers"]["content-length"] = str(app.MAX_UPLOAD_BYTES + 1)
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 400
+
+    def test_function_url_unknown_route_returns_404(self, lambda_context):
+        """Test Function URL events for unknown routes return 404."""
+        event = create_function_url_event("/nonexistent")
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 404
+
+    def test_rest_static_route(self, api_gateway_event, lambda_context):
+        """Test REST events for static routes match the main handler."""
+        event = create_event_for_path(api_gateway_event, "/hello")
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response == app.lambda_handler(event, lambda_context)
+
+    def test_rest_other_routes_use_main_handler(
+        self, api_gateway_event, lambda_context
+    ):
+        """Test REST events outside the route table go through lambda_handler."""
+        event = create_event_for_path(api_gateway_event, "/upload", "POST")
+
+        response = app.lambda_handler_fast(event, lambda_context)
+
+        assert response["statusCode"] == 200
+        body = orjson.loads(response["body"])
+        assert body["message"] == "Upload API - HTTP 200"
+
+
 # Performance and Load Testing
 class TestPerformance:
     """Performance-related test cases."""
 
-    def test_cold_start_metrics(self, api_gateway_event, lambda_context):
+    def test_cold_start_metrics(
+        self, patch_powertools, api_gateway_event, lambda_context
+    ):
         """Test that cold start metrics are captured."""
+        _, mock_metrics = patch_powertools
         event = create_event_for_path(api_gateway_event, "/hello")
 
-        with patch("hello_world.app.metrics") as mock_metrics:
-            app.lambda_handler(event, lambda_context)
+        app.lambda_handler(event, lambda_context)
+
+        # The @metrics.log_metrics decorator should handle cold start metrics
+        # This is automatically handled by AWS Lambda Powertools
+        assert (
+            mock_metrics.log_metrics.called or True
+        )  # Placeholder for actual metric verification
+
+    @patch("hello_world.app._first_invocation", True)
+    def test_health_ping_first_reports_cold_start(
+        self, monkeypatch, capsys, api_gateway_event, lambda_context
+    ):
+        """Test a sandbox whose first request is a health ping reports cold start."""
+        monkeypatch.setattr(cold_start, "is_cold_start", True)
+
+        outputs = []
+        for path in ["/healthcheck", "/healthcheck", "/healthcheck", "/hello"]:
+            event = create_event_for_path(api_gateway_event, path)
+            response = app.lambda_handler(event, lambda_context)
+            assert response["statusCode"] == 200
+            outputs.append(capsys.readouterr().out)
+
+        # Only the first (health ping) invocation emits the ColdStart metric
+        assert '"ColdStart"' in outputs[0]
+        assert not any('"ColdStart"' in output for output in outputs[1:])
+
+    @pytest.mark.parametrize("first_invocation", [True, False])
+    @patch("hello_world.app.get_tracer")
+    def test_healthcheck_skips_tracer(
+        self,
+        mock_get_tracer,
+        first_invocation,
+        monkeypatch,
+        api_gateway_event,
+        lambda_context,
+    ):
+        """Test health pings never create the tracer, including a cold start."""
+        monkeypatch.setattr("hello_world.app._first_invocation", first_invocation)
+        event = create_event_for_path(api_gateway_event, "/healthcheck")
+
+        response = app.lambda_handler(event, lambda_context)
+
+        assert response["statusCode"] == 200
+
+        mock_get_tracer.assert_not_called()
 
-            # The @metrics.log_metrics decorator should handle cold start metrics
-            # This is automatically handled by AWS Lambda Powertools
-            assert (
-                mock_metrics.log_metrics.called or True
-            )  # Placeholder for actual metric verification
+    def test_get_tracer_returns_shared_instance(self):
+        """Test the lazily created tracer is reused across calls."""
+        assert app.get_tracer() is app.get_tracer()
 
     def test_multiple_requests_same_instance(self, api_gateway_event, lambda_context):
         """Test multiple requests to simulate warm Lambda execution."""
@@ -352,5 +642,5 @@ class TestPerformance:
         # All should succeed
         for response in responses:
             assert response["statusCode"] == 200
-            body = json.loads(response["body"])
+            body = orjson.loads(response["body"])
             assert body["message"] == "hello world"